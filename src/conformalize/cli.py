@@ -7,31 +7,11 @@ from click import command
 from rich.pretty import pretty_repr
 from typed_settings import click_options
 from utilities.click import CONTEXT_SETTINGS
-from utilities.inflect import counted_noun
 from utilities.logging import basic_config
 from utilities.os import is_pytest
 from utilities.text import repr_str, strip_and_dedent
 
 from conformalize import __version__
-from conformalize.lib import (
-    add_bumpversion_toml,
-    add_coveragerc_toml,
-    add_envrc,
-    add_github_pull_request_yaml,
-    add_github_push_yaml,
-    add_pre_commit_config_yaml,
-    add_pyproject_toml,
-    add_pyrightconfig_json,
-    add_pytest_toml,
-    add_readme_md,
-    add_ruff_toml,
-    check_versions,
-    run_bump_my_version,
-    run_pre_commit_update,
-    run_ripgrep_and_replace,
-    update_action_file_extensions,
-    update_action_versions,
-)
 from conformalize.logging import LOGGER
 from conformalize.settings import LOADER, Settings
 
@@ -44,6 +24,27 @@ if TYPE_CHECKING:
 def _main(settings: Settings, /) -> None:
     if is_pytest():
         return
+
+    from conformalize.lib import (
+        add_bumpversion_toml,
+        add_coveragerc_toml,
+        add_envrc,
+        add_github_pull_request_yaml,
+        add_github_push_yaml,
+        add_pre_commit_config_yaml,
+        add_pyproject_toml,
+        add_pyrightconfig_json,
+        add_pytest_toml,
+        add_readme_md,
+        add_ruff_toml,
+        check_versions,
+        run_bump_my_version,
+        run_pre_commit_update,
+        run_ripgrep_and_replace,
+        update_action_file_extensions,
+        update_action_versions,
+    )
+
     basic_config(obj=LOGGER)
     LOGGER.info(
         strip_and_dedent("""
@@ -115,7 +116,7 @@ def _main(settings: Settings, /) -> None:
             pytest__resolution__lowest_direct=settings.github__pull_request__pytest__resolution__lowest_direct,
             pytest__timeout=settings.pytest__timeout,
             python_version=settings.python_version,
-            ruff=settings.ruff,
+            ruff=settings.github__pull_request__ruff,
             script=settings.script,
         )
     if (
@@ -183,6 +184,8 @@ def _main(settings: Settings, /) -> None:
     if settings.run_version_bump:
         run_bump_my_version(modifications=modifications)
     if len(modifications) >= 1:
+        from utilities.inflect import counted_noun
+
         LOGGER.info(
             "Exiting due to %s: %s",
             counted_noun(modifications, "modification"),
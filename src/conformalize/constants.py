@@ -17,6 +17,7 @@ PRE_COMMIT_CONFIG_YAML = Path(".pre-commit-config.yaml")
 PYPROJECT_TOML = Path("pyproject.toml")
 PYRIGHTCONFIG_JSON = Path("pyrightconfig.json")
 PYTEST_TOML = Path("pytest.toml")
+PYTHON_VERSION = "3.14"
 README_MD = Path("README.md")
 REPO_ROOT = get_repo_root()
 RUFF_TOML = Path("ruff.toml")
@@ -37,6 +38,7 @@ __all__ = [
     "PYPROJECT_TOML",
     "PYRIGHTCONFIG_JSON",
     "PYTEST_TOML",
+    "PYTHON_VERSION",
     "README_MD",
     "REPO_ROOT",
     "RUFF_TOML",
@@ -1,26 +1,26 @@
 from __future__ import annotations
 
 import json
+import tomllib
 from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from io import StringIO
-from itertools import product
 from pathlib import Path
-from re import MULTILINE, escape, sub
+from re import MULTILINE, Match, escape, sub
+from re import compile as compile_regex
 from shlex import join
 from string import Template
 from subprocess import CalledProcessError
-from typing import TYPE_CHECKING, Any, Literal, assert_never
+from typing import TYPE_CHECKING, Any, Literal, assert_never, cast
 
 import tomlkit
 from rich.pretty import pretty_repr
 from ruamel.yaml.scalarstring import LiteralScalarString
 from tomlkit import TOMLDocument, aot, array, document, table
-from tomlkit.exceptions import NonExistentKey
 from tomlkit.items import AoT, Array, Table
 from utilities.atomicwrites import writer
 from utilities.functions import ensure_class
 from utilities.iterables import OneEmptyError, OneNonUniqueError, one
-from utilities.pathlib import get_repo_root
 from utilities.subprocess import append_text, ripgrep, run
 from utilities.tempfile import TemporaryFile
 from utilities.text import strip_and_dedent
@@ -39,15 +39,17 @@ from conformalize.constants import (
     PYPROJECT_TOML,
     PYRIGHTCONFIG_JSON,
     PYTEST_TOML,
+    PYTHON_VERSION,
     README_MD,
+    REPO_ROOT,
     RUFF_TOML,
     YAML_INSTANCE,
 )
 from conformalize.logging import LOGGER
-from conformalize.settings import SETTINGS
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator, MutableSet
+    from collections.abc import Callable, Iterable, Iterator, MutableSet, Sequence
+    from contextlib import AbstractContextManager
 
     from utilities.types import PathLike
 
@@ -57,12 +59,11 @@ if TYPE_CHECKING:
 def add_bumpversion_toml(
     *,
     modifications: MutableSet[Path] | None = None,
-    pyproject: bool = SETTINGS.pyproject,
-    python_package_name_use: str | None = SETTINGS.python_package_name_use,
+    pyproject: bool = False,
+    python_package_name_use: str | None = None,
 ) -> None:
     with yield_bumpversion_toml(modifications=modifications) as doc:
-        tool = get_table(doc, "tool")
-        bumpversion = get_table(tool, "bumpversion")
+        bumpversion = get_nested(doc, "tool", "bumpversion", getter=get_table)
         if pyproject:
             files = get_aot(bumpversion, "files")
             ensure_aot_contains(
@@ -114,8 +115,8 @@ def add_envrc(
     *,
     modifications: MutableSet[Path] | None = None,
     uv: bool = False,
-    version: str = SETTINGS.python_version,
-    script: str | None = SETTINGS.script,
+    version: str = PYTHON_VERSION,
+    script: str | None = None,
 ) -> None:
     with yield_text_file(ENVRC, modifications=modifications) as temp:
         shebang = strip_and_dedent("""
@@ -165,21 +166,21 @@ def add_envrc(
 def add_github_pull_request_yaml(
     *,
     modifications: MutableSet[Path] | None = None,
-    pre_commit: bool = SETTINGS.github__pull_request__pre_commit,
-    pyright: bool = SETTINGS.github__pull_request__pyright,
-    pytest__os__windows: bool = SETTINGS.github__pull_request__pytest__os__windows,
-    pytest__os__macos: bool = SETTINGS.github__pull_request__pytest__os__macos,
-    pytest__os__ubuntu: bool = SETTINGS.github__pull_request__pytest__os__ubuntu,
-    pytest__python_version__default: bool = SETTINGS.github__pull_request__pytest__python_version__default,
-    pytest__python_version__3_12: bool = SETTINGS.github__pull_request__pytest__python_version__3_12,
-    pytest__python_version__3_13: bool = SETTINGS.github__pull_request__pytest__python_version__3_13,
-    pytest__python_version__3_14: bool = SETTINGS.github__pull_request__pytest__python_version__3_14,
-    pytest__resolution__highest: bool = SETTINGS.github__pull_request__pytest__resolution__highest,
-    pytest__resolution__lowest_direct: bool = SETTINGS.github__pull_request__pytest__resolution__lowest_direct,
-    pytest__timeout: int | None = SETTINGS.pytest__timeout,
-    python_version: str = SETTINGS.python_version,
-    ruff: bool = SETTINGS.github__pull_request__ruff,
-    script: str | None = SETTINGS.script,
+    pre_commit: bool = False,
+    pyright: bool = False,
+    pytest__os__windows: bool = False,
+    pytest__os__macos: bool = False,
+    pytest__os__ubuntu: bool = False,
+    pytest__python_version__default: bool = False,
+    pytest__python_version__3_12: bool = False,
+    pytest__python_version__3_13: bool = False,
+    pytest__python_version__3_14: bool = False,
+    pytest__resolution__highest: bool = False,
+    pytest__resolution__lowest_direct: bool = False,
+    pytest__timeout: int | None = None,
+    python_version: str = PYTHON_VERSION,
+    ruff: bool = False,
+    script: str | None = None,
 ) -> None:
     with yield_yaml_dict(
         GITHUB_PULL_REQUEST_YAML, modifications=modifications
@@ -278,12 +279,12 @@ def add_github_pull_request_yaml(
 def add_github_push_yaml(
     *,
     modifications: MutableSet[Path] | None = None,
-    publish: bool = SETTINGS.github__push__publish,
-    publish__trusted_publishing: bool = SETTINGS.github__push__publish__trusted_publishing,
-    tag: bool = SETTINGS.github__push__tag,
-    tag__major_minor: bool = SETTINGS.github__push__tag__major_minor,
-    tag__major: bool = SETTINGS.github__push__tag__major,
-    tag__latest: bool = SETTINGS.github__push__tag__latest,
+    publish: bool = False,
+    publish__trusted_publishing: bool = False,
+    tag: bool = False,
+    tag__major_minor: bool = False,
+    tag__major: bool = False,
+    tag__latest: bool = False,
 ) -> None:
     with yield_yaml_dict(GITHUB_PUSH_YAML, modifications=modifications) as dict_:
         dict_["name"] = "push"
@@ -330,14 +331,14 @@ def add_github_push_yaml(
 def add_pre_commit_config_yaml(
     *,
     modifications: MutableSet[Path] | None = None,
-    dockerfmt: bool = SETTINGS.pre_commit__dockerfmt,
-    dycw: bool = SETTINGS.pre_commit__dycw,
-    prettier: bool = SETTINGS.pre_commit__prettier,
-    ruff: bool = SETTINGS.pre_commit__ruff,
-    shell: bool = SETTINGS.pre_commit__shell,
-    taplo: bool = SETTINGS.pre_commit__taplo,
-    uv: bool = SETTINGS.pre_commit__uv,
-    script: str | None = SETTINGS.script,
+    dockerfmt: bool = False,
+    dycw: bool = False,
+    prettier: bool = False,
+    ruff: bool = False,
+    shell: bool = False,
+    taplo: bool = False,
+    uv: bool = False,
+    script: str | None = None,
 ) -> None:
     with yield_yaml_dict(PRE_COMMIT_CONFIG_YAML, modifications=modifications) as dict_:
         _add_pre_commit_config_repo(
@@ -472,52 +473,72 @@ def _add_pre_commit_config_repo(
 def add_pyproject_toml(
     *,
     modifications: MutableSet[Path] | None = None,
-    version: str = SETTINGS.python_version,
-    description: str | None = SETTINGS.description,
-    package_name: str | None = SETTINGS.package_name,
-    readme: bool = SETTINGS.readme,
-    optional_dependencies__scripts: bool = SETTINGS.pyproject__project__optional_dependencies__scripts,
-    python_package_name: str | None = SETTINGS.python_package_name,
-    python_package_name_use: str | None = SETTINGS.python_package_name_use,
-    tool__uv__indexes: list[tuple[str, str]] = SETTINGS.pyproject__tool__uv__indexes,
+    version: str = PYTHON_VERSION,
+    description: str | None = None,
+    package_name: str | None = None,
+    readme: bool = False,
+    optional_dependencies__scripts: bool = False,
+    python_package_name: str | None = None,
+    python_package_name_use: str | None = None,
+    tool__uv__indexes: Sequence[tuple[str, str]] = (),
 ) -> None:
+    patch = _get_pyproject_toml_patch(
+        version=version,
+        description=description,
+        package_name=package_name,
+        readme=readme,
+        optional_dependencies__scripts=optional_dependencies__scripts,
+        python_package_name=python_package_name,
+        python_package_name_use=python_package_name_use,
+        tool__uv__indexes=tool__uv__indexes,
+    )
+    with suppress(FileNotFoundError):
+        if is_toml_patch_applied(tomllib.loads(PYPROJECT_TOML.read_text()), patch):
+            return
     with yield_toml_doc(PYPROJECT_TOML, modifications=modifications) as doc:
-        build_system = get_table(doc, "build-system")
-        build_system["build-backend"] = "uv_build"
-        build_system["requires"] = ["uv_build"]
-        project = get_table(doc, "project")
-        project["requires-python"] = f">= {version}"
-        if description is not None:
-            project["description"] = description
-        if package_name is not None:
-            project["name"] = package_name
-        if readme:
-            project["readme"] = "README.md"
-        project.setdefault("version", "0.1.0")
-        dependency_groups = get_table(doc, "dependency-groups")
-        dev = get_array(dependency_groups, "dev")
-        ensure_contains(dev, "dycw-utilities[test]")
-        ensure_contains(dev, "rich")
-        if optional_dependencies__scripts:
-            optional_dependencies = get_table(project, "optional-dependencies")
-            scripts = get_array(optional_dependencies, "scripts")
-            ensure_contains(scripts, "click >=8.3.1")
-        if python_package_name is not None:
-            tool = get_table(doc, "tool")
-            uv = get_table(tool, "uv")
-            build_backend = get_table(uv, "build-backend")
-            build_backend["module-name"] = python_package_name_use
-            build_backend["module-root"] = "src"
-        if len(tool__uv__indexes) >= 1:
-            tool = get_table(doc, "tool")
-            uv = get_table(tool, "uv")
-            indexes = get_aot(uv, "index")
-            for name, url in tool__uv__indexes:
-                index = table()
-                index["explicit"] = True
-                index["name"] = name
-                index["url"] = url
-                ensure_aot_contains(indexes, index)
+        apply_toml_patch(doc, patch)
+
+
+def _get_pyproject_toml_patch(
+    *,
+    version: str,
+    description: str | None,
+    package_name: str | None,
+    readme: bool,
+    optional_dependencies__scripts: bool,
+    python_package_name: str | None,
+    python_package_name_use: str | None,
+    tool__uv__indexes: Sequence[tuple[str, str]],
+) -> StrDict:
+    project: StrDict = {"requires-python": f">= {version}"}
+    if description is not None:
+        project["description"] = description
+    if package_name is not None:
+        project["name"] = package_name
+    if readme:
+        project["readme"] = "README.md"
+    if optional_dependencies__scripts:
+        project["optional-dependencies"] = {"scripts": ["click >=8.3.1"]}
+    project["version"] = TOMLDefaultPatch("0.1.0")
+    patch: StrDict = {
+        "build-system": {"build-backend": "uv_build", "requires": ("uv_build",)},
+        "project": project,
+        "dependency-groups": {"dev": ["dycw-utilities[test]", "rich"]},
+    }
+    uv: StrDict = {}
+    if python_package_name is not None:
+        uv["build-backend"] = {
+            "module-name": python_package_name_use,
+            "module-root": "src",
+        }
+    if len(tool__uv__indexes) >= 1:
+        uv["index"] = TOMLAoTPatch([
+            {"explicit": True, "name": name, "url": url}
+            for name, url in tool__uv__indexes
+        ])
+    if len(uv) >= 1:
+        patch["tool"] = {"uv": uv}
+    return patch
 
 
 ##
@@ -526,8 +547,8 @@ def add_pyproject_toml(
 def add_pyrightconfig_json(
     *,
     modifications: MutableSet[Path] | None = None,
-    version: str = SETTINGS.python_version,
-    script: str | None = SETTINGS.script,
+    version: str = PYTHON_VERSION,
+    script: str | None = None,
 ) -> None:
     with yield_json_dict(PYRIGHTCONFIG_JSON, modifications=modifications) as dict_:
         dict_["deprecateTypingAliases"] = True
@@ -563,12 +584,12 @@ def add_pyrightconfig_json(
 def add_pytest_toml(
     *,
     modifications: MutableSet[Path] | None = None,
-    asyncio: bool = SETTINGS.pytest__asyncio,
-    ignore_warnings: bool = SETTINGS.pytest__ignore_warnings,
-    timeout: int | None = SETTINGS.pytest__timeout,
-    coverage: bool = SETTINGS.coverage,
-    python_package_name: str | None = SETTINGS.python_package_name_use,
-    script: str | None = SETTINGS.script,
+    asyncio: bool = False,
+    ignore_warnings: bool = False,
+    timeout: int | None = None,
+    coverage: bool = False,
+    python_package_name: str | None = None,
+    script: str | None = None,
 ) -> None:
     with yield_toml_doc(PYTEST_TOML, modifications=modifications) as doc:
         pytest = get_table(doc, "pytest")
@@ -618,8 +639,8 @@ def add_pytest_toml(
 def add_readme_md(
     *,
     modifications: MutableSet[Path] | None = None,
-    name: str | None = SETTINGS.package_name,
-    description: str | None = SETTINGS.description,
+    name: str | None = None,
+    description: str | None = None,
 ) -> None:
     with yield_text_file(README_MD, modifications=modifications) as temp:
         lines: list[str] = []
@@ -634,9 +655,7 @@ def add_readme_md(
 
 
 def add_ruff_toml(
-    *,
-    modifications: MutableSet[Path] | None = None,
-    version: str = SETTINGS.python_version,
+    *, modifications: MutableSet[Path] | None = None, version: str = PYTHON_VERSION
 ) -> None:
     with yield_toml_doc(RUFF_TOML, modifications=modifications) as doc:
         doc["target-version"] = f"py{version.replace('.', '')}"
@@ -695,16 +714,18 @@ def add_ruff_toml(
             "RUF029",  # unused-async
         ]
         ensure_contains(select, "ALL", *selected_rules)
-        extend_per_file_ignores = get_table(lint, "extend-per-file-ignores")
-        test_py = get_array(extend_per_file_ignores, "test_*.py")
+        test_py = get_nested(
+            lint, "extend-per-file-ignores", "test_*.py", getter=get_array
+        )
         test_py_rules = [
             "S101",  # assert
             "SLF001",  # private-member-access
         ]
         ensure_contains(test_py, *test_py_rules)
         ensure_not_contains(ignore, *selected_rules, *test_py_rules)
-        bugbear = get_table(lint, "flake8-bugbear")
-        extend_immutable_calls = get_array(bugbear, "extend-immutable-calls")
+        extend_immutable_calls = get_nested(
+            lint, "flake8-bugbear", "extend-immutable-calls", getter=get_array
+        )
         ensure_contains(extend_immutable_calls, "typing.cast")
         tidy_imports = get_table(lint, "flake8-tidy-imports")
         tidy_imports["ban-relative-imports"] = "all"
@@ -747,20 +768,36 @@ def check_versions() -> None:
 
 
 def ensure_aot_contains(array: AoT, /, *tables: Table) -> None:
+    keys = {_canonicalize_toml(t.unwrap()) for t in array}
     for table_ in tables:
-        if table_ not in array:
+        key = _canonicalize_toml(table_.unwrap())
+        if key not in keys:
             array.append(table_)
+            keys.add(key)
 
 
 def ensure_contains(array: HasAppend, /, *objs: Any) -> None:
     if isinstance(array, AoT):
         msg = f"Use {ensure_aot_contains.__name__!r} instead of {ensure_contains.__name__!r}"
         raise TypeError(msg)
+    hashables = {o for o in array if _is_hashable(o)}
     for obj in objs:
-        if obj not in array:
+        if _is_hashable(obj):
+            if obj not in hashables:
+                array.append(obj)
+                hashables.add(obj)
+        elif obj not in array:
             array.append(obj)
 
 
+def _is_hashable(obj: Any, /) -> bool:
+    try:
+        _ = hash(obj)
+    except TypeError:
+        return False
+    return True
+
+
 def ensure_contains_partial(
     container: HasAppend, partial: StrDict, /, *, extra: StrDict | None = None
 ) -> StrDict:
@@ -785,24 +822,113 @@ def ensure_not_contains(array: Array, /, *objs: Any) -> None:
 ##
 
 
+@dataclass(frozen=True, slots=True)
+class TOMLAoTPatch:
+    tables: Sequence[StrDict]
+
+
+@dataclass(frozen=True, slots=True)
+class TOMLDefaultPatch:
+    value: Any
+
+
+def apply_toml_patch(container: HasSetDefault, patch: StrDict, /) -> None:
+    for key, value in patch.items():
+        match value:
+            case dict():
+                apply_toml_patch(get_table(container, key), value)
+            case tuple():
+                container[key] = list(value)
+            case list():
+                ensure_contains(get_array(container, key), *value)
+            case TOMLAoTPatch(tables=tables):
+                ensure_aot_contains(get_aot(container, key), *map(_to_table, tables))
+            case TOMLDefaultPatch(value=default):
+                _ = container.setdefault(key, default)
+            case _:
+                container[key] = value
+
+
+def is_toml_patch_applied(data: Any, patch: Any, /) -> bool:
+    match patch:
+        case dict():
+            return isinstance(data, dict) and all(
+                (key in data) and is_toml_patch_applied(data[key], value)
+                for key, value in patch.items()
+            )
+        case tuple():
+            return _canonicalize_toml(data) == _canonicalize_toml(list(patch))
+        case list():
+            return _is_toml_list_superset(data, patch)
+        case TOMLAoTPatch(tables=tables):
+            return _is_toml_list_superset(data, tables)
+        case TOMLDefaultPatch():
+            return True
+        case _:
+            return _canonicalize_toml(data) == _canonicalize_toml(patch)
+
+
+def _is_toml_list_superset(data: Any, items: Iterable[Any], /) -> bool:
+    if not isinstance(data, list):
+        return False
+    keys = {_canonicalize_toml(d) for d in cast("list[Any]", data)}
+    return all(_canonicalize_toml(i) in keys for i in items)
+
+
+def _to_table(dict_: StrDict, /) -> Table:
+    tab = table()
+    tab.update(dict_)
+    return tab
+
+
+##
+
+
 def get_aot(container: HasSetDefault, key: str, /) -> AoT:
-    return ensure_class(container.setdefault(key, aot()), AoT)
+    return _get_or_insert(container, key, aot, AoT)
 
 
 def get_array(container: HasSetDefault, key: str, /) -> Array:
-    return ensure_class(container.setdefault(key, array()), Array)
+    return _get_or_insert(container, key, array, Array)
 
 
 def get_dict(container: HasSetDefault, key: str, /) -> StrDict:
-    return ensure_class(container.setdefault(key, {}), dict)
+    return _get_or_insert(container, key, dict, dict)
 
 
 def get_list(container: HasSetDefault, key: str, /) -> list[Any]:
-    return ensure_class(container.setdefault(key, []), list)
+    return _get_or_insert(container, key, list, list)
 
 
 def get_table(container: HasSetDefault, key: str, /) -> Table:
-    return ensure_class(container.setdefault(key, table()), Table)
+    return _get_or_insert(container, key, table, Table)
+
+
+def _get_or_insert[T](
+    container: HasSetDefault, key: str, factory: Callable[[], Any], cls: type[T], /
+) -> T:
+    # unlike 'setdefault', only build the default on a miss
+    try:
+        value = container[key]
+    except KeyError:
+        value = container[key] = factory()
+        return value
+    if __debug__:
+        return ensure_class(value, cls)
+    return cast("T", value)
+
+
+def get_nested[T](
+    container: HasSetDefault,
+    key: str,
+    /,
+    *keys: str,
+    getter: Callable[[HasSetDefault, str], T],
+) -> T:
+    *parents, last = (key, *keys)
+    for parent in parents:
+        container = get_table(container, parent)
+    return getter(container, last)
 
 
 ##
@@ -857,18 +983,30 @@ def get_version_from_bumpversion_toml(
 ) -> Version:
     match obj:
         case TOMLDocument() as doc:
-            tool = get_table(doc, "tool")
-            bumpversion = get_table(tool, "bumpversion")
+            bumpversion = get_nested(doc, "tool", "bumpversion", getter=get_table)
             return parse_version(str(bumpversion["current_version"]))
         case str() as text:
-            return get_version_from_bumpversion_toml(obj=tomlkit.parse(text))
+            current = tomllib.loads(text)["tool"]["bumpversion"]["current_version"]
+            return parse_version(str(current))
         case None:
+            if (current := _get_complete_bumpversion_version()) is not None:
+                return parse_version(current)
             with yield_bumpversion_toml() as doc:
                 return get_version_from_bumpversion_toml(obj=doc)
         case never:
             assert_never(never)
 
 
+def _get_complete_bumpversion_version() -> str | None:
+    try:
+        text = BUMPVERSION_TOML.read_text()
+        bumpversion = tomllib.loads(text)["tool"]["bumpversion"]
+        current = bumpversion["current_version"]
+    except (FileNotFoundError, KeyError):
+        return None
+    return str(current) if bumpversion.get("allow_dirty") is True else None
+
+
 def get_version_from_git_show() -> Version:
     text = run("git", "show", f"origin/master:{BUMPVERSION_TOML}", return_=True)
     return get_version_from_bumpversion_toml(obj=text.rstrip("\n"))
@@ -940,7 +1078,7 @@ def run_action_publish_dict(
 
 def run_action_pyright_dict(
     *,
-    python_version: str = SETTINGS.python_version,
+    python_version: str = PYTHON_VERSION,
     token_checkout: bool | str = False,
     token_uv: bool | str = False,
 ) -> StrDict:
@@ -1005,7 +1143,7 @@ def run_bump_my_version(*, modifications: MutableSet[Path] | None = None) -> Non
     except (CalledProcessError, ValueError):
         try:
             prev = get_version_from_git_show()
-        except (CalledProcessError, ParseVersionError, NonExistentKey):
+        except (CalledProcessError, ParseVersionError, KeyError):
             run_set_version(Version(0, 1, 0))
             return
     current = get_version_from_bumpversion_toml()
@@ -1018,7 +1156,7 @@ def run_bump_my_version(*, modifications: MutableSet[Path] | None = None) -> Non
 
 
 def run_pre_commit_update(*, modifications: MutableSet[Path] | None = None) -> None:
-    cache = xdg_cache_home() / "conformalize" / get_repo_root().name
+    cache = xdg_cache_home() / "conformalize" / REPO_ROOT.name
 
     def run_autoupdate() -> None:
         current = PRE_COMMIT_CONFIG_YAML.read_text()
@@ -1044,9 +1182,7 @@ def run_pre_commit_update(*, modifications: MutableSet[Path] | None = None) -> N
 
 
 def run_ripgrep_and_replace(
-    *,
-    version: str = SETTINGS.python_version,
-    modifications: MutableSet[Path] | None = None,
+    *, version: str = PYTHON_VERSION, modifications: MutableSet[Path] | None = None
 ) -> None:
     result = ripgrep(
         "--files-with-matches",
@@ -1101,29 +1237,35 @@ def update_action_file_extensions(
 ##
 
 
+_ACTION_VERSIONS = {
+    "actions/checkout": "v6",
+    "actions/setup-python": "v6",
+    "astral-sh/ruff-action": "v3",
+    "astral-sh/setup-uv": "v7",
+}
+_ACTION_VERSIONS_PATTERN = compile_regex(
+    rf"^(\s*- uses: ({'|'.join(map(escape, _ACTION_VERSIONS))}))@.+$", flags=MULTILINE
+)
+
+
 def update_action_versions(*, modifications: MutableSet[Path] | None = None) -> None:
     try:
         paths = list(Path(".github").rglob("**/*.yaml"))
     except FileNotFoundError:
         return
-    versions = {
-        "actions/checkout": "v6",
-        "actions/setup-python": "v6",
-        "astral-sh/ruff-action": "v3",
-        "astral-sh/setup-uv": "v7",
-    }
-    for path, (action, version) in product(paths, versions.items()):
-        text = sub(
-            rf"^(\s*- uses: {action})@.+$",
-            rf"\1@{version}",
-            path.read_text(),
-            flags=MULTILINE,
+    for path in paths:
+        text = _ACTION_VERSIONS_PATTERN.sub(
+            _update_action_versions_repl, path.read_text()
         )
         with yield_yaml_dict(path, modifications=modifications) as dict_:
             dict_.clear()
             dict_.update(YAML_INSTANCE.load(text))
 
 
+def _update_action_versions_repl(match: Match[str], /) -> str:
+    return f"{match[1]}@{_ACTION_VERSIONS[match[2]]}"
+
+
 ##
 
 
@@ -1135,11 +1277,21 @@ def write_text(
     *,
     modifications: MutableSet[Path] | None = None,
 ) -> None:
-    src, dest = map(Path, [src, dest])
+    _write_text(verb, Path(src).read_text(), dest, modifications=modifications)
+
+
+def _write_text(
+    verb: str,
+    text: str,
+    dest: PathLike,
+    /,
+    *,
+    modifications: MutableSet[Path] | None = None,
+) -> None:
+    dest = Path(dest)
     LOGGER.info("%s '%s'...", verb, dest)
-    text = src.read_text().rstrip("\n") + "\n"
     with writer(dest, overwrite=True) as temp:
-        _ = temp.write_text(text)
+        _ = temp.write_text(text.rstrip("\n") + "\n")
     if modifications is not None:
         modifications.add(dest)
 
@@ -1161,8 +1313,7 @@ def yield_bumpversion_toml(
     *, modifications: MutableSet[Path] | None = None
 ) -> Iterator[TOMLDocument]:
     with yield_toml_doc(BUMPVERSION_TOML, modifications=modifications) as doc:
-        tool = get_table(doc, "tool")
-        bumpversion = get_table(tool, "bumpversion")
+        bumpversion = get_nested(doc, "tool", "bumpversion", getter=get_table)
         bumpversion["allow_dirty"] = True
         bumpversion.setdefault("current_version", str(Version(0, 1, 0)))
         yield doc
@@ -1171,14 +1322,12 @@ def yield_bumpversion_toml(
 ##
 
 
-@contextmanager
 def yield_json_dict(
     path: PathLike, /, *, modifications: MutableSet[Path] | None = None
-) -> Iterator[StrDict]:
-    with yield_write_context(
+) -> AbstractContextManager[StrDict]:
+    return yield_write_context(
         path, json.loads, dict, json.dumps, modifications=modifications
-    ) as dict_:
-        yield dict_
+    )
 
 
 ##
@@ -1198,21 +1347,37 @@ def yield_text_file(
     else:
         with TemporaryFile(text=current) as temp:
             yield temp
-            if temp.read_text().rstrip("\n") != current.rstrip("\n"):
-                write_text("Writing", temp, path, modifications=modifications)
+            text = temp.read_text()
+            if text.rstrip("\n") != current.rstrip("\n"):
+                _write_text("Writing", text, path, modifications=modifications)
 
 
 ##
 
 
-@contextmanager
 def yield_toml_doc(
     path: PathLike, /, *, modifications: MutableSet[Path] | None = None
-) -> Iterator[TOMLDocument]:
-    with yield_write_context(
-        path, tomlkit.parse, document, tomlkit.dumps, modifications=modifications
-    ) as doc:
-        yield doc
+) -> AbstractContextManager[TOMLDocument]:
+    return yield_write_context(
+        path,
+        tomlkit.parse,
+        document,
+        tomlkit.dumps,
+        is_equal=_is_equal_toml_doc,
+        round_trip=True,
+        modifications=modifications,
+    )
+
+
+def _is_equal_toml_doc(doc: TOMLDocument, current: str, /) -> bool:
+    return _canonicalize_toml(doc.unwrap()) == _canonicalize_toml(
+        tomllib.loads(current)
+    )
+
+
+def _canonicalize_toml(data: Any, /) -> str:
+    # JSON keeps 'true' and '1' apart, unlike '=='
+    return json.dumps(data, sort_keys=True, default=str)
 
 
 ##
@@ -1226,42 +1391,47 @@ def yield_write_context[T](
     dumps: Callable[[T], str],
     /,
     *,
+    is_equal: Callable[[T, str], bool] | None = None,
+    round_trip: bool = False,
     modifications: MutableSet[Path] | None = None,
 ) -> Iterator[T]:
     path = Path(path)
 
-    def run_write(verb: str, data: T, /) -> None:
-        with writer(path, overwrite=True) as temp:
-            _ = temp.write_text(dumps(data))
-            write_text(verb, temp, path, modifications=modifications)
-
     try:
         current = path.read_text()
     except FileNotFoundError:
         yield (default := get_default())
-        run_write("Writing", default)
+        _write_text("Writing", dumps(default), path, modifications=modifications)
     else:
         data = loads(current)
         yield data
-        is_equal = data == loads(current)  # tomlkit cannot handle !=
-        if not is_equal:
-            run_write("Modifying", data)
+        text = dumps(data) if round_trip else None
+        if text == current:  # e.g. tomlkit round-trips unchanged documents
+            return
+        equal = (
+            (data == loads(current))  # tomlkit cannot handle !=
+            if is_equal is None
+            else is_equal(data, current)
+        )
+        if not equal:
+            text = dumps(data) if text is None else text
+            _write_text("Modifying", text, path, modifications=modifications)
 
 
 ##
 
 
-@contextmanager
 def yield_yaml_dict(
     path: PathLike, /, *, modifications: MutableSet[Path] | None = None
-) -> Iterator[StrDict]:
-    with yield_write_context(
+) -> AbstractContextManager[StrDict]:
+    return yield_write_context(
         path, YAML_INSTANCE.load, dict, yaml_dump, modifications=modifications
-    ) as dict_:
-        yield dict_
+    )
 
 
 __all__ = [
+    "TOMLAoTPatch",
+    "TOMLDefaultPatch",
     "add_bumpversion_toml",
     "add_coveragerc_toml",
     "add_envrc",
@@ -1274,6 +1444,7 @@ __all__ = [
     "add_readme_md",
     "add_ruff_toml",
     "add_token_to_with_dict",
+    "apply_toml_patch",
     "check_versions",
     "ensure_aot_contains",
     "ensure_contains",
@@ -1283,12 +1454,14 @@ __all__ = [
     "get_array",
     "get_dict",
     "get_list",
+    "get_nested",
     "get_partial_dict",
     "get_table",
     "get_version_from_bumpversion_toml",
     "get_version_from_git_show",
     "get_version_from_git_tag",
     "is_partial_dict",
+    "is_toml_patch_applied",
     "run_action_pre_commit_dict",
     "run_action_publish_dict",
     "run_action_pyright_dict",
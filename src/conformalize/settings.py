@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typed_settings import EnvLoader, load_settings, option, settings
+from typed_settings import EnvLoader, option, settings
 
-from conformalize.constants import RUN_VERSION_BUMP
+from conformalize.constants import PYTHON_VERSION, RUN_VERSION_BUMP
 
 
 @settings
@@ -110,7 +110,7 @@ class Settings:
     python_package_name: str | None = option(
         default=None, help="Python package name override"
     )
-    python_version: str = option(default="3.14", help="Python version")
+    python_version: str = option(default=PYTHON_VERSION, help="Python version")
     readme: bool = option(default=False, help="Set up 'README.md'")
     repo_name: str | None = option(default=None, help="Repo name")
     ruff: bool = option(default=False, help="Set up 'ruff.toml'")
@@ -129,7 +129,6 @@ class Settings:
 
 
 LOADER = EnvLoader("")
-SETTINGS = load_settings(Settings, [LOADER])
 
 
-__all__ = ["LOADER", "SETTINGS", "Settings"]
+__all__ = ["LOADER", "Settings"]
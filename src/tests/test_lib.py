@@ -1,15 +1,183 @@
 from __future__ import annotations
 
+import tomllib
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pytest import mark, param
+from tomlkit import aot, document, table
+from tomlkit.items import AoT, Array
 from utilities.iterables import one
+from utilities.text import strip_and_dedent
+from utilities.version import Version
 
 if TYPE_CHECKING:
+    from pytest import MonkeyPatch
+
     from conformalize.types import StrDict
 
 
-from conformalize.lib import get_partial_dict, is_partial_dict
+from conformalize.lib import (
+    TOMLAoTPatch,
+    TOMLDefaultPatch,
+    add_coveragerc_toml,
+    add_pyproject_toml,
+    add_pyrightconfig_json,
+    apply_toml_patch,
+    ensure_aot_contains,
+    ensure_contains,
+    get_aot,
+    get_nested,
+    get_partial_dict,
+    get_table,
+    get_version_from_bumpversion_toml,
+    is_partial_dict,
+    is_toml_patch_applied,
+    update_action_versions,
+    yield_toml_doc,
+)
+
+
+class TestAddCoveragercTOML:
+    def test_int_for_bool(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        add_coveragerc_toml()
+        path = tmp_path.joinpath(".coveragerc.toml")
+        _ = path.write_text(path.read_text().replace("branch = true", "branch = 1"))
+        modifications: set[Path] = set()
+        add_coveragerc_toml(modifications=modifications)
+        assert modifications == {Path(".coveragerc.toml")}
+        assert tomllib.loads(path.read_text())["run"]["branch"] is True
+
+
+class TestAddPyprojectTOML:
+    def test_rerun(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        add_pyproject_toml()
+        path = tmp_path.joinpath("pyproject.toml")
+        inode = path.stat().st_ino
+        modifications: set[Path] = set()
+        add_pyproject_toml(modifications=modifications)
+        assert modifications == set()
+        assert path.stat().st_ino == inode
+
+    def test_version_default(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        add_pyproject_toml()
+        path = tmp_path.joinpath("pyproject.toml")
+        _ = path.write_text(path.read_text().replace('version = "0.1.0"\n', ""))
+        add_pyproject_toml()
+        assert tomllib.loads(path.read_text())["project"]["version"] == "0.1.0"
+
+    def test_version_kept(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        add_pyproject_toml()
+        path = tmp_path.joinpath("pyproject.toml")
+        _ = path.write_text(path.read_text().replace('"0.1.0"', '"1.2.3"'))
+        modifications: set[Path] = set()
+        add_pyproject_toml(modifications=modifications)
+        assert modifications == set()
+        assert tomllib.loads(path.read_text())["project"]["version"] == "1.2.3"
+
+    def test_indexes(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        indexes = [("name1", "url1"), ("name2", "url2")]
+        add_pyproject_toml(tool__uv__indexes=indexes)
+        add_pyproject_toml(tool__uv__indexes=indexes)
+        path = tmp_path.joinpath("pyproject.toml")
+        assert tomllib.loads(path.read_text())["tool"]["uv"]["index"] == [
+            {"explicit": True, "name": "name1", "url": "url1"},
+            {"explicit": True, "name": "name2", "url": "url2"},
+        ]
+
+
+class TestAddPyrightconfigJSON:
+    def test_trailing_newline(
+        self, *, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        add_pyrightconfig_json()
+        assert tmp_path.joinpath("pyrightconfig.json").read_text().endswith("}\n")
+
+    def test_rerun(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        add_pyrightconfig_json()
+        modifications: set[Path] = set()
+        add_pyrightconfig_json(modifications=modifications)
+        assert modifications == set()
+
+
+class TestApplyTOMLPatch:
+    def test_main(self) -> None:
+        doc = document()
+        doc["build-system"] = {"requires": ["setuptools"]}
+        doc["dependency-groups"] = {"dev": ["pytest"]}
+        doc["project"] = {"version": "1.2.3"}
+        patch: StrDict = {
+            "build-system": {"build-backend": "uv_build", "requires": ("uv_build",)},
+            "dependency-groups": {"dev": ["pytest", "rich"]},
+            "project": {
+                "authors": [{"name": "name"}],
+                "version": TOMLDefaultPatch("0.1.0"),
+            },
+            "tool": {"uv": {"index": TOMLAoTPatch([{"name": "name", "url": "url"}])}},
+        }
+        apply_toml_patch(doc, patch)
+        apply_toml_patch(doc, patch)
+        expected = {
+            "build-system": {"requires": ["uv_build"], "build-backend": "uv_build"},
+            "dependency-groups": {"dev": ["pytest", "rich"]},
+            "project": {"version": "1.2.3", "authors": [{"name": "name"}]},
+            "tool": {"uv": {"index": [{"name": "name", "url": "url"}]}},
+        }
+        assert doc.unwrap() == expected
+        assert isinstance(get_table(doc, "project")["authors"], Array)
+        assert isinstance(get_nested(doc, "tool", "uv", getter=get_table)["index"], AoT)
+        assert is_toml_patch_applied(doc.unwrap(), patch)
+
+    def test_default(self) -> None:
+        doc = document()
+        apply_toml_patch(doc, {"project": {"version": TOMLDefaultPatch("0.1.0")}})
+        assert doc.unwrap() == {"project": {"version": "0.1.0"}}
+
+
+class TestEnsureAOTContains:
+    def test_main(self) -> None:
+        array = aot()
+        tab = table()
+        tab["name"] = "name"
+        ensure_aot_contains(array, tab, tab)
+        assert array.unwrap() == [{"name": "name"}]
+
+    def test_type_strict(self) -> None:
+        array = aot()
+        tab1 = table()
+        tab1["explicit"] = 1
+        tab2 = table()
+        tab2["explicit"] = True
+        ensure_aot_contains(array, tab1, tab2, tab2)
+        assert array.unwrap() == [{"explicit": 1}, {"explicit": True}]
+
+
+class TestEnsureContains:
+    def test_main(self) -> None:
+        array: list[Any] = ["a", {"b": 1}]
+        ensure_contains(array, "a", "c", "c", {"b": 1}, {"d": 2}, {"d": 2})
+        assert array == ["a", {"b": 1}, "c", {"d": 2}]
+
+    def test_unhashable_tuple(self) -> None:
+        array: list[Any] = [("a", [1])]
+        ensure_contains(array, ("a", [1]), ("b", [2]))
+        assert array == [("a", [1]), ("b", [2])]
+
+
+class TestGetNested:
+    def test_main(self) -> None:
+        doc = document()
+        result = get_nested(doc, "tool", "uv", "index", getter=get_aot)
+        assert isinstance(result, AoT)
+        assert get_nested(doc, "tool", "uv", "index", getter=get_aot) is result
+        assert doc.unwrap() == {"tool": {"uv": {"index": []}}}
 
 
 class TestGetPartialDict:
@@ -22,6 +190,52 @@ class TestGetPartialDict:
         assert result == one(repos_list)
 
 
+class TestGetVersionFromBumpversionToml:
+    def test_complete_file(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path.joinpath(".bumpversion.toml")
+        text = strip_and_dedent("""
+            [tool.bumpversion]
+              allow_dirty = true
+              current_version = "1.2.3"
+        """)
+        _ = path.write_text(text)
+        inode = path.stat().st_ino
+        result = get_version_from_bumpversion_toml()
+        assert result == Version(1, 2, 3)
+        assert path.stat().st_ino == inode
+        assert path.read_text() == text
+
+    def test_incomplete_file(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path.joinpath(".bumpversion.toml")
+        _ = path.write_text('[tool.bumpversion]\ncurrent_version = "1.2.3"\n')
+        result = get_version_from_bumpversion_toml()
+        assert result == Version(1, 2, 3)
+        assert tomllib.loads(path.read_text())["tool"]["bumpversion"] == {
+            "allow_dirty": True,
+            "current_version": "1.2.3",
+        }
+
+    def test_missing_file(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        result = get_version_from_bumpversion_toml()
+        assert result == Version(0, 1, 0)
+        path = tmp_path.joinpath(".bumpversion.toml")
+        assert tomllib.loads(path.read_text())["tool"]["bumpversion"] == {
+            "allow_dirty": True,
+            "current_version": "0.1.0",
+        }
+
+    def test_text(self) -> None:
+        text = strip_and_dedent("""
+            [tool.bumpversion]
+              current_version = "1.2.3"
+        """)
+        result = get_version_from_bumpversion_toml(obj=text)
+        assert result == Version(1, 2, 3)
+
+
 class TestIsPartialDict:
     @mark.parametrize(
         ("obj", "dict_", "expected"),
@@ -45,3 +259,77 @@ class TestIsPartialDict:
     )
     def test_main(self, *, obj: Any, dict_: StrDict, expected: bool) -> None:
         assert is_partial_dict(obj, dict_) is expected
+
+
+class TestIsTOMLPatchApplied:
+    @mark.parametrize(
+        ("data", "patch", "expected"),
+        [
+            param({}, {}, True),
+            param({"a": 1}, {}, True),
+            param({}, {"a": 1}, False),
+            param({"a": 1}, {"a": 1}, True),
+            param({"a": 1}, {"a": 2}, False),
+            param({"a": 1}, {"a": True}, False),
+            param({"a": ["x", "y"]}, {"a": ["y"]}, True),
+            param({"a": ["x"]}, {"a": ["y"]}, False),
+            param({"a": ["x", "y"]}, {"a": ("y",)}, False),
+            param({"a": ["y"]}, {"a": ("y",)}, True),
+            param({"a": {"b": 1, "c": 2}}, {"a": {"b": 1}}, True),
+            param({"a": {"b": 1}}, {"a": {"b": 1, "c": 2}}, False),
+            param({"a": 1}, {"a": {"b": 1}}, False),
+            param({"a": [1]}, {"a": [True]}, False),
+            param({}, {"a": TOMLDefaultPatch(1)}, False),
+            param({"a": 2}, {"a": TOMLDefaultPatch(1)}, True),
+            param(
+                {"a": [{"b": 1, "c": 2}]}, {"a": TOMLAoTPatch([{"b": 1, "c": 2}])}, True
+            ),
+            param({"a": [{"b": 1}]}, {"a": TOMLAoTPatch([{"b": 1, "c": 2}])}, False),
+            param({"a": [{"b": 1}]}, {"a": TOMLAoTPatch([{"b": True}])}, False),
+            param({"a": {"b": 1}}, {"a": TOMLAoTPatch([{"b": 1}])}, False),
+        ],
+    )
+    def test_main(self, *, data: StrDict, patch: StrDict, expected: bool) -> None:
+        assert is_toml_patch_applied(data, patch) is expected
+
+
+class TestUpdateActionVersions:
+    def test_main(self, *, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path.joinpath(".github", "workflows", "push.yaml")
+        path.parent.mkdir(parents=True)
+        _ = path.write_text(
+            strip_and_dedent("""
+                jobs:
+                  job:
+                    steps:
+                      - uses: actions/checkout@v4
+                      - uses: actions/checkout-foo@v1
+                      - uses: astral-sh/setup-uv@v5
+            """)
+        )
+        update_action_versions()
+        result = path.read_text()
+        assert "- uses: actions/checkout@v6\n" in result
+        assert "- uses: actions/checkout-foo@v1\n" in result
+        assert "- uses: astral-sh/setup-uv@v7\n" in result
+
+
+class TestYieldTOMLDoc:
+    def test_formatting_only(self, *, tmp_path: Path) -> None:
+        path = tmp_path.joinpath("file.toml")
+        _ = path.write_text("a = 0x1\n")
+        modifications: set[Path] = set()
+        with yield_toml_doc(path, modifications=modifications) as doc:
+            doc["a"] = 1
+        assert modifications == set()
+        assert path.read_text() == "a = 0x1\n"
+
+    def test_value_change(self, *, tmp_path: Path) -> None:
+        path = tmp_path.joinpath("file.toml")
+        _ = path.write_text("a = 1\n")
+        modifications: set[Path] = set()
+        with yield_toml_doc(path, modifications=modifications) as doc:
+            doc["a"] = 2
+        assert modifications == {path}
+        assert path.read_text() == "a = 2\n"